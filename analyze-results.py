@@ -8,117 +8,269 @@ Analyzes multi-sample attack simulation and performance test results with full s
 - Multi-iteration data aggregation
 
 Usage: python analyze-results-enhanced.py
+       DRAFT=1 python analyze-results-enhanced.py   (faster 100 DPI preview charts)
 Output: ./analysis-output/ directory with 10 charts and 4 CSV files
 """
 
+import codecs
+import csv
+import hashlib
+import io
 import json
+import math
 import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import redirect_stdout
+from itertools import repeat
+from fnmatch import fnmatch
+from functools import lru_cache, wraps
 from pathlib import Path
+from types import MappingProxyType
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
-from statsmodels.stats.power import TTestIndPower
+from scipy.special import stdtrit
 from datetime import datetime
 import warnings
-warnings.filterwarnings('ignore')
 
-# Set publication-quality defaults
-plt.rcParams['figure.dpi'] = 300
-plt.rcParams['savefig.dpi'] = 300
-plt.rcParams['font.size'] = 10
-plt.rcParams['font.family'] = 'serif'
-plt.rcParams['figure.figsize'] = (10, 6)
+# orjson is an optional, faster drop-in for JSON decoding
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Publication-quality output (DRAFT=1 renders quick 100 DPI previews)
+# Charts are saved at CHART_DPI; table PNGs are rendered text and stay
+# legible at TABLE_DPI, so every savefig passes its resolution explicitly
+CHART_DPI = 100 if os.environ.get('DRAFT') else 300
+TABLE_DPI = min(CHART_DPI, 150)
+
+# Shared styling for the bar charts, applied around render_bar_chart
+BAR_CHART_RC = MappingProxyType({
+    'axes.titlesize': 14,
+    'axes.titleweight': 'bold',
+    'axes.titlepad': 20,
+    'axes.labelsize': 12,
+    'axes.labelweight': 'bold',
+    'grid.linestyle': '--',
+    'grid.alpha': 0.3,
+    'patch.force_edgecolor': True,
+    'patch.edgecolor': 'black',
+    'legend.fontsize': 11
+})
+
+CONFIG_ORDER = ('baseline', 'config1', 'config2', 'config3')
+
+# Tick labels for the grouped charts
+CONFIG_LABELS_SHORT = MappingProxyType({
+    'baseline': 'Baseline',
+    'config1': 'Config 1\n(NSG)',
+    'config2': 'Config 2\n(ASG)',
+    'config3': 'Config 3\n(Firewall)'
+})
+
+# Tick labels for the headline success rate chart
+CONFIG_LABELS_LONG = MappingProxyType({
+    'baseline': 'Baseline\n(Flat Network)',
+    'config1': 'Config 1\n(NSG Segmentation)',
+    'config2': 'Config 2\n(ASG Segmentation)',
+    'config3': 'Config 3\n(Firewall + NSG + ASG)'
+})
+
+# Single-line labels for tables and the heatmap
+CONFIG_LABELS_TABLE = MappingProxyType({
+    'baseline': 'Baseline',
+    'config1': 'Config 1 (NSG)',
+    'config2': 'Config 2 (ASG)',
+    'config3': 'Config 3 (Firewall)'
+})
+
+PALETTE_SUCCESS = ('#d62728', '#ff7f0e', '#2ca02c', '#1f77b4')
+PALETTE_THROUGHPUT = ('#3498db', '#9b59b6', '#1abc9c', '#e67e22')
 
 OUTPUT_DIR = Path("./analysis-output")
 OUTPUT_DIR.mkdir(exist_ok=True)
-
-print("=" * 70)
-print("Enhanced Statistical Analysis - Azure Micro-Segmentation Research")
-print("=" * 70)
-print()
+CACHE_DIR = OUTPUT_DIR / ".cache"
+
+# OUTPUT_FORMAT=svg writes vector charts and tables, skipping rasterisation
+# and PNG encoding entirely
+OUTPUT_FORMAT = 'svg' if os.environ.get('OUTPUT_FORMAT', '').lower() == 'svg' else 'png'
+
+ATTACK_METRICS = (
+    'overall_success_rate',
+    'rdp_success_rate',
+    'smb_success_rate',
+    'total_attempts',
+    'successful_movements'
+)
+
+# Attack result Metrics fields and the metric names they load into
+ATTACK_FIELDS = MappingProxyType({
+    'LateralMovementSuccessRate': 'overall_success_rate',
+    'RDPSuccessRate': 'rdp_success_rate',
+    'SMBSuccessRate': 'smb_success_rate',
+    'TotalLateralMovementAttempts': 'total_attempts',
+    'SuccessfulLateralMovements': 'successful_movements'
+})
+
+PERF_METRICS = (
+    'latency_avg',
+    'latency_p95',
+    'latency_p99',
+    'throughput',
+    'auth_overhead',
+    'cpu_usage',
+    'memory_usage'
+)
+
+# Columns of individual_iterations.csv: (header, data section, metric)
+ITERATION_EXPORT_COLUMNS = (
+    ('Success_Rate', 'attack_iterations', 'overall_success_rate'),
+    ('RDP_Success', 'attack_iterations', 'rdp_success_rate'),
+    ('SMB_Success', 'attack_iterations', 'smb_success_rate'),
+    ('Latency_Avg', 'perf_iterations', 'latency_avg'),
+    ('Latency_P95', 'perf_iterations', 'latency_p95'),
+    ('Latency_P99', 'perf_iterations', 'latency_p99'),
+    ('Throughput', 'perf_iterations', 'throughput'),
+    ('CPU_Usage', 'perf_iterations', 'cpu_usage'),
+    ('Memory_Usage', 'perf_iterations', 'memory_usage')
+)
+
+# Metrics in the overhead table and the direction in which they get worse
+OVERHEAD_METRICS = MappingProxyType({
+    'latency_avg': 'latency',
+    'throughput': 'throughput',
+    'cpu_usage': 'other',
+    'memory_usage': 'other'
+})
+
+# Cohen's d thresholds (small/medium/large) drawn on the effect size chart
+EFFECT_SIZE_THRESHOLDS = (0.2, -0.2, 0.5, -0.5, 0.8, -0.8)
+EFFECT_SIZE_THRESHOLD_COLORS = ('gray', 'gray', 'orange', 'orange', 'red', 'red')
+
+# Per-iteration metrics compared against baseline with Cohen's d
+EFFECT_SIZE_METRICS = (
+    ('attack_iterations', 'overall_success_rate'),
+    ('perf_iterations', 'latency_avg'),
+    ('perf_iterations', 'cpu_usage')
+)
+
+SEARCH_LOCATIONS = {
+    'attack': [
+        "./AttackResults",
+        "./ResearchData",
+        "C:/AttackResults",
+        "C:/ResearchData"
+    ],
+    'performance': [
+        "./PerformanceResults",
+        "./ResearchData",
+        "C:/PerformanceResults",
+        "C:/ResearchData"
+    ]
+}
 
 
 # ============================================================================
 # STATISTICAL ANALYSIS FUNCTIONS
 # ============================================================================
 
-def calculate_confidence_interval(data, confidence=0.95):
+@lru_cache(maxsize=256)
+def t_critical_value(confidence, df):
     """
-    Calculates confidence interval using t-distribution.
+    Returns the two-sided Student-t critical value for a confidence level and degrees of freedom.
 
-    Args:
-        data: Array of numeric values
-        confidence: Confidence level (default 0.95)
-
-    Returns:
-        Dict with mean, lower, upper, margin, std, n
+    Calls the stdtrit special function directly, which is what stats.t.ppf
+    evaluates underneath its generic distribution machinery.
     """
-    data = np.array(data)
-    data = data[~np.isnan(data)]
+    return float(stdtrit(df, (1 + confidence) / 2))
 
-    if len(data) == 0:
-        return {'mean': np.nan, 'lower': np.nan, 'upper': np.nan, 'margin': np.nan, 'std': np.nan, 'n': 0}
 
-    if len(data) == 1:
-        return {'mean': data[0], 'lower': np.nan, 'upper': np.nan, 'margin': np.nan, 'std': 0, 'n': 1}
+def calculate_confidence_intervals(data, confidence=0.95):
+    """
+    Calculates confidence intervals for several metrics in one pass.
 
-    mean = np.mean(data)
-    std = np.std(data, ddof=1)
-    n = len(data)
+    NaN values are excluded per metric, so rows may have different sample sizes.
 
-    t_value = stats.t.ppf((1 + confidence) / 2, n - 1)
-    margin = t_value * (std / np.sqrt(n))
+    Args:
+        data: 2D array with one row of samples per metric
+        confidence: Confidence level (default 0.95)
 
-    return {
-        'mean': mean,
-        'lower': mean - margin,
-        'upper': mean + margin,
-        'margin': margin,
-        'std': std,
-        'n': n
-    }
+    Returns:
+        List of dicts (one per row) with mean, lower, upper, margin, std, n
+    """
+    data = np.asarray(data, dtype=np.float64)
+    counts = np.count_nonzero(~np.isnan(data), axis=1)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = np.nansum(data, axis=1) / counts
+        deviations = data - means[:, np.newaxis]
+        stds = np.sqrt(np.nansum(deviations * deviations, axis=1) / (counts - 1))
+
+        t_values = np.full(len(counts), np.nan)
+        has_df = counts > 1
+        t_values[has_df] = [t_critical_value(confidence, int(df)) for df in counts[has_df] - 1]
+        margins = t_values * (stds / np.sqrt(counts))
+
+    results = []
+    for mean, std, margin, n in zip(means, stds, margins, counts):
+        n = int(n)
+        if n == 0:
+            results.append({'mean': np.nan, 'lower': np.nan, 'upper': np.nan, 'margin': np.nan, 'std': np.nan, 'n': 0})
+        elif n == 1:
+            results.append({'mean': mean, 'lower': np.nan, 'upper': np.nan, 'margin': np.nan, 'std': 0, 'n': 1})
+        else:
+            results.append({
+                'mean': mean,
+                'lower': mean - margin,
+                'upper': mean + margin,
+                'margin': margin,
+                'std': std,
+                'n': n
+            })
+
+    return results
 
 
-def calculate_cohens_d(group1, group2):
+def calculate_cohens_d_batch(reference, groups):
     """
-    Calculates Cohen's d effect size.
+    Calculates Cohen's d of one reference group against several groups in one pass.
+
+    Each group's mean and standard deviation are taken with np.mean and
+    np.std exactly as for a single comparison, so the published values stay
+    bit-stable; only the pooling and the final ratio are vectorized. NaN
+    values are excluded from every group.
 
     Args:
-        group1: Array of values for group 1
-        group2: Array of values for group 2
+        reference: Array of values for the reference group (group 1)
+        groups: Sequence of arrays, one per comparison group (group 2)
 
     Returns:
-        Cohen's d value
+        Array with one Cohen's d per group, NaN where it is undefined
     """
-    group1 = np.array(group1)
-    group2 = np.array(group2)
-
-    group1 = group1[~np.isnan(group1)]
-    group2 = group2[~np.isnan(group2)]
-
-    if len(group1) < 2 or len(group2) < 2:
-        return np.nan
+    reference = np.asarray(reference, dtype=np.float64)
+    reference = reference[~np.isnan(reference)]
+    n1 = len(reference)
 
-    mean1 = np.mean(group1)
-    mean2 = np.mean(group2)
-    std1 = np.std(group1, ddof=1)
-    std2 = np.std(group2, ddof=1)
-    n1 = len(group1)
-    n2 = len(group2)
+    if n1 < 2:
+        return np.full(len(groups), np.nan)
 
-    pooled_std = np.sqrt(((n1 - 1) * std1**2 + (n2 - 1) * std2**2) / (n1 + n2 - 2))
+    groups = [group[~np.isnan(group)] for group in (np.asarray(g, dtype=np.float64) for g in groups)]
+    counts = np.array([len(group) for group in groups])
+    means, stds = np.array([(group.mean(), group.std(ddof=1)) if len(group) >= 2 else (np.nan, np.nan)
+                            for group in groups]).reshape(-1, 2).T
 
-    if pooled_std == 0:
-        return np.nan
+    with np.errstate(invalid='ignore', divide='ignore'):
+        pooled_std = np.sqrt(((n1 - 1) * reference.std(ddof=1)**2 + (counts - 1) * stds**2) / (n1 + counts - 2))
+        d = (reference.mean() - means) / pooled_std
 
-    return (mean1 - mean2) / pooled_std
+    d[(counts < 2) | (pooled_std == 0)] = np.nan
+    return d
 
 
 def interpret_effect_size(d):
     """Interprets Cohen's d value."""
-    if np.isnan(d):
+    if math.isnan(d):
         return "Undefined"
     abs_d = abs(d)
     if abs_d < 0.2:
@@ -131,33 +283,34 @@ def interpret_effect_size(d):
         return "Large"
 
 
-def calculate_performance_overhead(baseline_value, config_value, metric_type='latency'):
+def calculate_performance_overheads(metrics, metric_types):
     """
-    Calculates performance overhead relative to baseline.
+    Calculates performance overhead relative to baseline for every config at once.
 
     Args:
-        baseline_value: Baseline performance value
-        config_value: Configuration performance value
-        metric_type: 'latency' (higher is worse) or 'throughput' (lower is worse)
+        metrics: DataFrame of metric means indexed by config, including 'baseline'
+        metric_types: Mapping of metric column to 'latency' (higher is worse),
+                      'throughput' (lower is worse) or 'other'
 
     Returns:
-        Overhead percentage
+        DataFrame of overhead percentages with the same index, one column per
+        metric; NaN where the baseline or config value is missing or zero
     """
-    if np.isnan(baseline_value) or np.isnan(config_value) or baseline_value == 0:
-        return np.nan
+    values = metrics[list(metric_types)]
+    baseline = values.loc['baseline']
 
-    # If config value is 0 or extremely small, it indicates missing/failed data
-    if config_value == 0 or (metric_type == 'throughput' and config_value < 1):
-        return np.nan
+    # For throughput a decrease is the overhead, for everything else an increase
+    throughput = [m for m, kind in metric_types.items() if kind == 'throughput']
+    change = values - baseline
+    change[throughput] = baseline[throughput] - values[throughput]
 
-    if metric_type == 'latency':
-        # For latency, increase is bad
-        overhead = ((config_value - baseline_value) / baseline_value) * 100
-    elif metric_type == 'throughput':
-        # For throughput, decrease is bad
-        overhead = ((baseline_value - config_value) / baseline_value) * 100
-    else:
-        overhead = ((config_value - baseline_value) / baseline_value) * 100
+    overhead = change / baseline * 100
+
+    # A zero config value (or sub-1 Mbps throughput) indicates missing/failed data
+    invalid = values.eq(0)
+    invalid[throughput] |= values[throughput] < 1
+    overhead = overhead.mask(invalid)
+    overhead.loc[:, baseline.eq(0)] = np.nan
 
     return overhead
 
@@ -174,36 +327,37 @@ def calculate_statistical_power(effect_size, n, alpha=0.05):
     Returns:
         Power value (0-1)
     """
-    if np.isnan(effect_size) or n < 2:
+    if math.isnan(effect_size) or n < 2:
         return np.nan
 
+    return solve_power(abs(effect_size), n, alpha)
+
+
+@lru_cache(maxsize=None)
+def power_analysis():
+    """Returns a shared TTestIndPower instance, importing statsmodels on first use."""
+    from statsmodels.stats.power import TTestIndPower
+    return TTestIndPower()
+
+
+@lru_cache(maxsize=256)
+def solve_power(effect_size, n, alpha):
+    """Solves two-sided t-test power, memoized since comparisons repeat across tables."""
     try:
-        power_analysis = TTestIndPower()
-        power = power_analysis.solve_power(
-            effect_size=abs(effect_size),
-            nobs1=n,
-            alpha=alpha,
-            alternative='two-sided'
-        )
-        return power
+        # Extreme effect sizes overflow the noncentral t evaluation; the
+        # resulting NaN is reported as N/A, so the RuntimeWarning is noise
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            return power_analysis().solve_power(
+                effect_size=effect_size,
+                nobs1=n,
+                alpha=alpha,
+                alternative='two-sided'
+            )
     except:
         return np.nan
 
 
-def interpret_power(power):
-    """Interprets statistical power value."""
-    if np.isnan(power):
-        return "Undefined"
-    if power < 0.50:
-        return "Low"
-    elif power < 0.80:
-        return "Moderate"
-    elif power < 0.95:
-        return "High"
-    else:
-        return "Excellent"
-
-
 def validate_sample_size(n, config_name):
     """Validates and warns about sample size."""
     if n < 3:
@@ -219,144 +373,286 @@ def validate_sample_size(n, config_name):
 # MULTI-SAMPLE DATA LOADING
 # ============================================================================
 
-def find_config_files(base_dirs, config_name, file_type):
+@lru_cache(maxsize=None)
+def existing_search_locations(file_type):
+    """Returns the search locations for a file type that exist on this machine."""
+    return tuple(Path(d) for d in SEARCH_LOCATIONS.get(file_type, ()) if Path(d).exists())
+
+
+def walk_matching_files(base_path, pattern):
+    """
+    Recursively yields files under base_path whose names match a glob pattern.
+
+    Uses os.scandir directly so only matching entries are turned into Paths.
+    """
+    pending = [base_path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif fnmatch(entry.name, pattern):
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
+@lru_cache(maxsize=None)
+def index_json_files(base_path):
+    """
+    Lists every JSON file under a search location, walking the tree once.
+
+    Search locations are shared between file types (ResearchData holds all
+    three) and every configuration is looked up in each of them, so the
+    listing is cached per location and filtered in memory afterwards.
+    """
+    return tuple(walk_matching_files(base_path, "*.json"))
+
+
+@lru_cache(maxsize=None)
+def find_config_files(config_name, file_type):
     """
     Finds all iteration files for a configuration.
 
     Args:
-        base_dirs: List of directories to search
         config_name: Config name (e.g., 'baseline')
-        file_type: 'attack' or 'performance' or 'summary'
+        file_type: 'attack' or 'performance'
 
     Returns:
-        List of file paths
+        Sorted tuple of file paths
     """
     patterns = {
         'attack': f"attack-results-{config_name}-run*-*.json",
-        'performance': f"performance-{config_name}-run*-*.json",
-        'summary': f"summary-{config_name}-run*-*.json"
+        'performance': f"performance-{config_name}-run*-*.json"
     }
 
     pattern = patterns.get(file_type, f"*{config_name}-run*-*.json")
 
     files = []
-    for base_dir in base_dirs:
-        base_path = Path(base_dir)
-        if base_path.exists():
-            found = list(base_path.glob(f"**/{pattern}"))
-            files.extend(found)
+    for base_path in existing_search_locations(file_type):
+        files.extend(f for f in index_json_files(base_path) if fnmatch(f.name, pattern))
 
-    return sorted(files)
+    return tuple(sorted(files))
 
 
-def load_attack_iterations(config_name):
+def mean_of_field(items, field, require_success=False):
     """
-    Loads all attack result iterations for a configuration.
+    Averages one numeric field across a list of test records.
+
+    Missing or zero values (and failed records when require_success is set)
+    are skipped. The lists hold one record per target, so a running sum is
+    cheaper than building an array to reduce.
 
     Returns:
-        List of dicts with metrics from each iteration
+        Mean value, or 0 if no record has a usable value
     """
-    search_locations = [
-        "./AttackResults",
-        "./ResearchData",
-        "C:/AttackResults",
-        "C:/ResearchData"
-    ]
+    total = 0.0
+    count = 0
+    for item in items:
+        if require_success and not item.get('Success'):
+            continue
+        value = item.get(field)
+        if value:
+            total += float(value)
+            count += 1
 
-    files = find_config_files(search_locations, config_name, 'attack')
+    return total / count if count else 0
 
-    iterations = []
-    for file_path in files:
-        try:
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                data = json.load(f)
-
-            metrics = data.get('Metrics', {})
-            iterations.append({
-                'overall_success_rate': metrics.get('LateralMovementSuccessRate', 0),
-                'rdp_success_rate': metrics.get('RDPSuccessRate', 0),
-                'smb_success_rate': metrics.get('SMBSuccessRate', 0),
-                'total_attempts': metrics.get('TotalLateralMovementAttempts', 0),
-                'successful_movements': metrics.get('SuccessfulLateralMovements', 0)
-            })
-        except Exception as e:
-            print(f"    Error reading {file_path.name}: {e}")
-            continue
 
-    return iterations
+def read_json_file(file_path):
+    """
+    Reads and decodes a JSON results file.
+
+    PowerShell's Out-File -Encoding UTF8 prefixes a byte order mark, which is
+    stripped before handing the raw bytes to the decoder.
+    """
+    raw = Path(file_path).read_bytes()
+    if raw.startswith(codecs.BOM_UTF8):
+        raw = raw[len(codecs.BOM_UTF8):]
+    return json_loads(raw)
 
 
-def load_performance_iterations(config_name):
+def parse_attack_file(file_path):
+    """
+    Reads the Metrics section of a single attack result file.
+
+    Returns:
+        Dict of raw metric fields for the iteration, or None if the file is unreadable
+    """
+    try:
+        return dict(read_json_file(file_path).get('Metrics', {}))
+    except Exception as e:
+        print(f"    Error reading {file_path.name}: {e}")
+        return None
+
+
+def parse_performance_file(file_path):
+    """
+    Parses a single performance test file.
+
+    Returns:
+        Dict with metrics for the iteration, or None if the file is unreadable
+    """
+    try:
+        data = read_json_file(file_path)
+
+        tests = data.get('Tests', {})
+
+        latency_data = tests.get('Latency', [])
+        throughput_data = tests.get('Throughput', [])
+        auth_data = tests.get('Authentication', [])
+
+        resource_data = tests.get('ResourceUtilization', {})
+        cpu_usage = resource_data.get('CPU', {}).get('AveragePercent', 0)
+        memory_usage = resource_data.get('Memory', {}).get('UsedPercent', 0)
+
+        return {
+            'latency_avg': mean_of_field(latency_data, 'AvgLatency'),
+            'latency_p95': mean_of_field(latency_data, 'P95Latency'),
+            'latency_p99': mean_of_field(latency_data, 'P99Latency'),
+            'throughput': mean_of_field(throughput_data, 'ThroughputMbps', require_success=True),
+            'auth_overhead': mean_of_field(auth_data, 'AvgAuthTime', require_success=True),
+            'cpu_usage': cpu_usage,
+            'memory_usage': memory_usage
+        }
+    except Exception as e:
+        print(f"    Error reading {file_path.name}: {e}")
+        return None
+
+
+def parse_files(parser, files):
+    """
+    Parses iteration files concurrently, preserving file order.
+
+    Returns:
+        List of parsed iterations, skipping unreadable files
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return [it for it in executor.map(parser, files) if it is not None]
+
+
+def to_columns(iterations, keys):
+    """
+    Transposes a list of per-iteration dicts into one array per metric.
+
+    Returns:
+        Dict mapping metric name to an array with one value per iteration
+    """
+    return {key: np.array([it[key] for it in iterations]) for key in keys}
+
+
+def iteration_count(columns):
+    """Returns the number of iterations held in a dict of metric arrays."""
+    return len(next(iter(columns.values()), ()))
+
+
+def load_attack_iterations(files):
+    """
+    Loads all attack result iterations for a configuration.
+
+    The Metrics sections are flat, so each one maps straight onto the
+    ATTACK_FIELDS spec; fields missing from a file count as 0. Each metric
+    keeps the dtype NumPy infers from its values, so whole-number rates stay
+    integers in the iteration export.
+
+    Returns:
+        Dict mapping each attack metric to an array of per-iteration values
+    """
+    iterations = [{metric: section.get(field, 0) for field, metric in ATTACK_FIELDS.items()}
+                  for section in parse_files(parse_attack_file, files)]
+    return to_columns(iterations, ATTACK_METRICS)
+
+
+def load_performance_iterations(files):
     """
     Loads all performance test iterations for a configuration.
 
     Returns:
-        List of dicts with metrics from each iteration
+        Dict mapping each performance metric to an array of per-iteration values
     """
-    search_locations = [
-        "./PerformanceResults",
-        "./ResearchData",
-        "C:/PerformanceResults",
-        "C:/ResearchData"
-    ]
+    return to_columns(parse_files(parse_performance_file, files), PERF_METRICS)
 
-    files = find_config_files(search_locations, config_name, 'performance')
 
-    iterations = []
-    for file_path in files:
-        try:
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                data = json.load(f)
-
-            tests = data.get('Tests', {})
-
-            latency_data = tests.get('Latency', [])
-            avg_latencies = [item.get('AvgLatency', 0) for item in latency_data if item.get('AvgLatency')]
-            p95_latencies = [item.get('P95Latency', 0) for item in latency_data if item.get('P95Latency')]
-            p99_latencies = [item.get('P99Latency', 0) for item in latency_data if item.get('P99Latency')]
-
-            throughput_data = tests.get('Throughput', [])
-            throughputs = [item.get('ThroughputMbps', 0) for item in throughput_data
-                          if item.get('Success') and item.get('ThroughputMbps')]
-
-            auth_data = tests.get('Authentication', [])
-            auth_times = [item.get('AvgAuthTime', 0) for item in auth_data
-                         if item.get('Success') and item.get('AvgAuthTime')]
-
-            resource_data = tests.get('ResourceUtilization', {})
-            cpu_usage = resource_data.get('CPU', {}).get('AveragePercent', 0)
-            memory_usage = resource_data.get('Memory', {}).get('UsedPercent', 0)
-
-            iterations.append({
-                'latency_avg': np.mean(avg_latencies) if avg_latencies else 0,
-                'latency_p95': np.mean(p95_latencies) if p95_latencies else 0,
-                'latency_p99': np.mean(p99_latencies) if p99_latencies else 0,
-                'throughput': np.mean(throughputs) if throughputs else 0,
-                'auth_overhead': np.mean(auth_times) if auth_times else 0,
-                'cpu_usage': cpu_usage,
-                'memory_usage': memory_usage
-            })
-        except Exception as e:
-            print(f"    Error reading {file_path.name}: {e}")
-            continue
+def aggregate_iterations(columns):
+    """
+    Calculates CI statistics for every metric across all iterations.
+
+    Returns:
+        Dict mapping metric name to its CI dict
+    """
+    if iteration_count(columns) == 0:
+        return {}
+
+    values = np.array(list(columns.values()), dtype=np.float64)
+    return dict(zip(columns.keys(), calculate_confidence_intervals(values)))
+
+
+def cache_key(config_name, files):
+    """
+    Builds a cache key from the input files and their modification times.
+
+    The script's own modification time is included so that edits to the
+    analysis code invalidate previously cached results.
+    """
+    stamps = [(str(p), p.stat().st_mtime_ns) for p in files]
+    stamps.append((__file__, Path(__file__).stat().st_mtime_ns))
+    return hashlib.blake2b(repr((config_name, stamps)).encode(), digest_size=16).hexdigest()
+
 
-    return iterations
+def read_cache(cache_file):
+    """Returns the cached object stored in cache_file, or None on a miss."""
+    if not cache_file.exists():
+        return None
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def write_cache(cache_file, obj, stale_pattern):
+    """Stores obj in cache_file, removing superseded entries for the same key prefix."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in CACHE_DIR.glob(stale_pattern):
+            stale.unlink()
+        with open(cache_file, 'wb') as f:
+            # Protocol 5 pickles the NumPy iteration arrays as raw buffers
+            pickle.dump(obj, f, protocol=5)
+    except OSError as e:
+        print(f"    Could not write cache {cache_file.name}: {e}")
 
 
 def aggregate_config_data(config_name):
     """
     Loads all iterations and calculates aggregated statistics.
 
+    Results are cached under analysis-output/.cache and reused while none of
+    the configuration's input files have changed. Reads that skipped an
+    unreadable file are not cached, so the error is reported on every run.
+
     Returns:
         Dict with iterations and aggregated stats with CI
     """
     print(f"  Loading {config_name}...")
 
-    attack_iters = load_attack_iterations(config_name)
-    perf_iters = load_performance_iterations(config_name)
+    attack_files = find_config_files(config_name, 'attack')
+    perf_files = find_config_files(config_name, 'performance')
+
+    cache_file = CACHE_DIR / f"{config_name}-{cache_key(config_name, attack_files + perf_files)}.pkl"
+    cached = read_cache(cache_file)
+    if cached is not None:
+        print(f"    Found {iteration_count(cached['attack_iterations'])} attack iterations, "
+              f"{iteration_count(cached['perf_iterations'])} performance iterations (cached)")
+        validate_sample_size(cached['n'], config_name)
+        return cached
+
+    attack_iters = load_attack_iterations(attack_files)
+    perf_iters = load_performance_iterations(perf_files)
 
-    n_attack = len(attack_iters)
-    n_perf = len(perf_iters)
+    n_attack = iteration_count(attack_iters)
+    n_perf = iteration_count(perf_iters)
     n = min(n_attack, n_perf) if n_attack > 0 and n_perf > 0 else max(n_attack, n_perf)
 
     if n == 0:
@@ -366,21 +662,10 @@ def aggregate_config_data(config_name):
     print(f"    Found {n_attack} attack iterations, {n_perf} performance iterations")
     validate_sample_size(n, config_name)
 
-    # Aggregate attack metrics
-    attack_metrics = {}
-    if attack_iters:
-        for key in attack_iters[0].keys():
-            values = [it[key] for it in attack_iters]
-            attack_metrics[key] = calculate_confidence_interval(values)
-
-    # Aggregate performance metrics
-    perf_metrics = {}
-    if perf_iters:
-        for key in perf_iters[0].keys():
-            values = [it[key] for it in perf_iters]
-            perf_metrics[key] = calculate_confidence_interval(values)
-
-    return {
+    attack_metrics = aggregate_iterations(attack_iters)
+    perf_metrics = aggregate_iterations(perf_iters)
+
+    result = {
         'config': config_name,
         'n': n,
         'attack_iterations': attack_iters,
@@ -389,6 +674,10 @@ def aggregate_config_data(config_name):
         'perf_metrics': perf_metrics
     }
 
+    if n_attack == len(attack_files) and n_perf == len(perf_files):
+        write_cache(cache_file, result, f"{config_name}-*.pkl")
+    return result
+
 
 def load_all_configurations():
     """
@@ -400,10 +689,9 @@ def load_all_configurations():
     print("\n[1] Loading Multi-Sample Data")
     print("-" * 70)
 
-    configs = ['baseline', 'config1', 'config2', 'config3']
     all_data = {}
 
-    for config in configs:
+    for config in CONFIG_ORDER:
         data = aggregate_config_data(config)
         if data:
             all_data[config] = data
@@ -423,387 +711,554 @@ def load_all_configurations():
 # VISUALIZATION WITH ERROR BARS
 # ============================================================================
 
-def create_lateral_movement_chart_with_ci(all_data):
-    """Creates bar chart with 95% CI error bars."""
-    print("\n[2] Generating lateral movement success rate chart with CI")
+@lru_cache(maxsize=None)
+def pyplot():
+    """
+    Imports and configures matplotlib on first use.
 
-    if not all_data:
-        print("  No data to plot")
-        return
+    Runs that find no data return before any plotting, so they never pay
+    for importing matplotlib.
 
-    configs = []
-    means = []
-    errors = []
+    Returns:
+        The matplotlib.pyplot module
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
 
-    config_order = ['baseline', 'config1', 'config2', 'config3']
-    for config in config_order:
-        if config in all_data:
-            metric = all_data[config]['attack_metrics'].get('overall_success_rate', {})
-            configs.append(config)
-            means.append(metric.get('mean', 0))
-            errors.append(metric.get('margin', 0))
+    # Figures are only ever saved to disk, so never redraw them interactively
+    plt.ioff()
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    plt.rcParams['figure.dpi'] = CHART_DPI
+    plt.rcParams['path.simplify'] = True
+    plt.rcParams['path.simplify_threshold'] = 1.0
+    plt.rcParams['font.size'] = 10
+    plt.rcParams['font.family'] = 'serif'
+    plt.rcParams['figure.figsize'] = (10, 6)
+    return plt
 
-    colors = ['#d62728', '#ff7f0e', '#2ca02c', '#1f77b4']
-    x = range(len(configs))
 
-    bars = ax.bar(x, means, color=colors[:len(configs)], alpha=0.8, edgecolor='black')
-    ax.errorbar(x, means, yerr=errors, fmt='none', color='black', capsize=5, linewidth=2)
+def with_rc(rc):
+    """Decorator that renders a chart with the given rcParams overrides in effect."""
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with pyplot().rc_context(rc):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
 
-    for i, (bar, mean, err) in enumerate(zip(bars, means, errors)):
-        height = bar.get_height()
-        if not np.isnan(err):
-            ax.text(bar.get_x() + bar.get_width()/2., height + err + 2,
-                    f'{mean:.1f}%\n±{err:.1f}',
-                    ha='center', va='bottom', fontweight='bold', fontsize=9)
-        else:
-            ax.text(bar.get_x() + bar.get_width()/2., height + 2,
-                    f'{mean:.1f}%',
-                    ha='center', va='bottom', fontweight='bold', fontsize=9)
-
-    ax.set_xlabel('Configuration', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Lateral Movement Success Rate (%)', fontsize=12, fontweight='bold')
-    ax.set_title('Lateral Movement Success Rate by Configuration (with 95% CI)',
-                 fontsize=14, fontweight='bold', pad=20)
-    ax.set_xticks(x)
 
-    config_labels = {
-        'baseline': 'Baseline\n(Flat Network)',
-        'config1': 'Config 1\n(NSG Segmentation)',
-        'config2': 'Config 2\n(ASG Segmentation)',
-        'config3': 'Config 3\n(Firewall + NSG + ASG)'
-    }
-    ax.set_xticklabels([config_labels.get(c, c) for c in configs], fontsize=10)
-    ax.set_ylim(0, 110)
-    ax.grid(axis='y', alpha=0.3, linestyle='--')
+@lru_cache(maxsize=None)
+def shared_figure():
+    """Returns the Figure shared by the charts and tables, so each render reuses one canvas."""
+    return pyplot().figure()
 
-    plt.tight_layout()
-    output_file = OUTPUT_DIR / "1_lateral_movement_success_rates.png"
-    plt.savefig(output_file, bbox_inches='tight')
-    print(f"  Saved: {output_file.name}")
-    plt.close()
 
+def reset_shared_figure(figsize, layout='constrained'):
+    """
+    Clears the shared figure and resizes it for the next chart or table.
 
-def create_attack_breakdown_chart_with_ci(all_data):
-    """Creates grouped bar chart with error bars for RDP vs SMB."""
-    print("\n[3] Generating attack method breakdown chart with CI")
+    Args:
+        figsize: (width, height) in inches
+        layout: Layout engine for the new contents; charts use constrained
+                layout so their margins are fitted within the single draw
+                made on save
 
-    if not all_data:
-        print("  No data to plot")
-        return
+    Returns:
+        The cleared Figure
+    """
+    fig = shared_figure()
+    fig.clear()
+    fig.set_size_inches(figsize)
+    fig.set_layout_engine(layout)
+    return fig
 
-    config_order = ['baseline', 'config1', 'config2', 'config3']
-    configs = [c for c in config_order if c in all_data]
 
-    rdp_means = []
-    rdp_errors = []
-    smb_means = []
-    smb_errors = []
+def figure_path(name):
+    """Returns the output path for a chart or table named name in OUTPUT_FORMAT."""
+    return OUTPUT_DIR / f"{name}.{OUTPUT_FORMAT}"
 
-    for config in configs:
-        rdp_metric = all_data[config]['attack_metrics'].get('rdp_success_rate', {})
-        smb_metric = all_data[config]['attack_metrics'].get('smb_success_rate', {})
 
-        rdp_means.append(rdp_metric.get('mean', 0))
-        rdp_errors.append(rdp_metric.get('margin', 0))
-        smb_means.append(smb_metric.get('mean', 0))
-        smb_errors.append(smb_metric.get('margin', 0))
+def save_figure(fig, output_file, dpi, bbox_inches=None):
+    """
+    Saves a figure as a PNG, or as an SVG when OUTPUT_FORMAT is 'svg'.
 
-    fig, ax = plt.subplots(figsize=(12, 6))
+    Deflate effort dominates PNG writing at these resolutions, so PNGs are
+    written with zlib level 1, trading slightly larger files for a much
+    faster save.
 
-    x = np.arange(len(configs))
-    width = 0.35
-
-    bars1 = ax.bar(x - width/2, rdp_means, width, label='RDP',
-                   color='#e74c3c', alpha=0.8, edgecolor='black')
-    bars2 = ax.bar(x + width/2, smb_means, width, label='SMB',
-                   color='#3498db', alpha=0.8, edgecolor='black')
-
-    ax.errorbar(x - width/2, rdp_means, yerr=rdp_errors, fmt='none', color='black', capsize=4)
-    ax.errorbar(x + width/2, smb_means, yerr=smb_errors, fmt='none', color='black', capsize=4)
-
-    for bars in [bars1, bars2]:
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.0f}%',
-                    ha='center', va='bottom', fontsize=9)
-
-    ax.set_xlabel('Configuration', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Success Rate (%)', fontsize=12, fontweight='bold')
-    ax.set_title('Lateral Movement Success Rate by Attack Method (with 95% CI)',
-                 fontsize=14, fontweight='bold', pad=20)
-    ax.set_xticks(x)
-    config_labels = {
-        'baseline': 'Baseline',
-        'config1': 'Config 1\n(NSG)',
-        'config2': 'Config 2\n(ASG)',
-        'config3': 'Config 3\n(Firewall)'
-    }
-    ax.set_xticklabels([config_labels.get(c, c) for c in configs], fontsize=10)
-    ax.set_ylim(0, 110)
-    ax.legend(fontsize=11, loc='upper right')
-    ax.grid(axis='y', alpha=0.3, linestyle='--')
-
-    plt.tight_layout()
-    output_file = OUTPUT_DIR / "2_attack_method_breakdown.png"
-    plt.savefig(output_file, bbox_inches='tight')
-    print(f"  Saved: {output_file.name}")
-    plt.close()
+    Args:
+        bbox_inches: 'tight' to crop the image to its contents; only the tables
+                     need this, as the charts are laid out to fill their figure
+    """
+    if OUTPUT_FORMAT == 'svg':
+        fig.savefig(output_file, dpi=dpi, bbox_inches=bbox_inches)
+    else:
+        fig.savefig(output_file, dpi=dpi, bbox_inches=bbox_inches,
+                    pil_kwargs={'compress_level': 1, 'optimize': False})
 
 
-def create_latency_chart_with_ci(all_data):
-    """Creates latency comparison chart with error bars."""
-    print("\n[4] Generating network latency comparison chart with CI")
+def figure_is_current(output_file, inputs, dpi):
+    """
+    Checks whether a chart or table was already rendered from the same inputs.
+
+    The key also covers the output DPI and the script's modification time,
+    so layout or code changes still re-render the image.
+
+    Args:
+        output_file: Image path
+        inputs: Everything the image is drawn from; hashed via its repr
+        dpi: Resolution the image is saved at
+
+    Returns:
+        Tuple of (is_current, key); pass the key to mark_figure_current after saving
+    """
+    script_mtime = Path(__file__).stat().st_mtime_ns
+    key = hashlib.sha256(repr((inputs, dpi, script_mtime)).encode()).hexdigest()
+
+    stamp = CACHE_DIR / f"{output_file.name}.sha256"
+    try:
+        is_current = output_file.exists() and stamp.read_text() == key
+    except OSError:
+        is_current = False
+    return is_current, key
 
-    if not all_data:
-        print("  No data to plot")
-        return
 
-    config_order = ['baseline', 'config1', 'config2', 'config3']
-    configs = [c for c in config_order if c in all_data]
+def mark_figure_current(output_file, key):
+    """Records the render key of a freshly saved image for figure_is_current."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (CACHE_DIR / f"{output_file.name}.sha256").write_text(key)
+    except OSError as e:
+        print(f"    Could not write cache stamp for {output_file.name}: {e}")
+
+
+def frame_inputs(frame):
+    """Returns a hashable snapshot of a frame's labels and exact float values for figure_is_current."""
+    return tuple(frame.index), tuple(frame.columns), frame.to_numpy().tobytes()
 
-    avg_means = []
-    avg_errors = []
-    p95_means = []
-    p99_means = []
 
-    for config in configs:
-        avg_metric = all_data[config]['perf_metrics'].get('latency_avg', {})
-        p95_metric = all_data[config]['perf_metrics'].get('latency_p95', {})
-        p99_metric = all_data[config]['perf_metrics'].get('latency_p99', {})
+@with_rc(BAR_CHART_RC)
+def render_bar_chart(metrics, series, title, ylabel, name, config_labels=CONFIG_LABELS_SHORT,
+                     figsize=(12, 6), width=0.35, ylim=None, legend_loc=None,
+                     value_format='{:.1f}', label_fontsize=9, skip_empty=False):
+    """
+    Renders a (grouped) bar chart of per-configuration metric means with 95% CI error bars.
+
+    Args:
+        metrics: Metrics frame from build_metrics_frame
+        series: List of (metric, label, color, show_ci) tuples, e.g.
+                ('rdp_success_rate', 'RDP', '#e74c3c', True).
+                A single series is drawn as one bar per config with the mean
+                and CI labelled above the error bar; color may then be a
+                list with one color per config.
+        title, ylabel: Axis text
+        name: Output file name inside OUTPUT_DIR, without extension
+        config_labels: Mapping of config name to x tick label
+        figsize, width, ylim, legend_loc: Layout options
+        value_format: Format string for bar value annotations
+        label_fontsize: Font size for bar value annotations
+        skip_empty: Don't annotate bars with zero height
+    """
+    output_file = figure_path(name)
+    keys = [key for key, *_ in series]
+    is_current, render_key = figure_is_current(
+        output_file, frame_inputs(metrics[keys + [f'{key}_margin' for key in keys]]), CHART_DPI)
+    if is_current:
+        print(f"  Up to date: {output_file.name}")
+        return
 
-        avg_means.append(avg_metric.get('mean', 0))
-        avg_errors.append(avg_metric.get('margin', 0))
-        p95_means.append(p95_metric.get('mean', 0))
-        p99_means.append(p99_metric.get('mean', 0))
+    configs = metrics.index
+    single = len(series) == 1
 
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig = reset_shared_figure(figsize)
+    ax = fig.add_subplot()
 
     x = np.arange(len(configs))
-    width = 0.25
-
-    bars1 = ax.bar(x - width, avg_means, width, label='Average',
-                   color='#2ecc71', alpha=0.8, edgecolor='black')
-    bars2 = ax.bar(x, p95_means, width, label='P95',
-                   color='#f39c12', alpha=0.8, edgecolor='black')
-    bars3 = ax.bar(x + width, p99_means, width, label='P99',
-                   color='#e74c3c', alpha=0.8, edgecolor='black')
-
-    ax.errorbar(x - width, avg_means, yerr=avg_errors, fmt='none', color='black', capsize=4)
-
-    for bars in [bars1, bars2, bars3]:
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{height:.1f}',
-                        ha='center', va='bottom', fontsize=8)
-
-    ax.set_xlabel('Configuration', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Latency (milliseconds)', fontsize=12, fontweight='bold')
-    ax.set_title('Network Latency Comparison (with 95% CI on Average)',
-                 fontsize=14, fontweight='bold', pad=20)
-    ax.set_xticks(x)
-    config_labels = {
-        'baseline': 'Baseline',
-        'config1': 'Config 1\n(NSG)',
-        'config2': 'Config 2\n(ASG)',
-        'config3': 'Config 3\n(Firewall)'
-    }
-    ax.set_xticklabels([config_labels.get(c, c) for c in configs], fontsize=10)
-    ax.legend(fontsize=11, loc='upper left')
-    ax.grid(axis='y', alpha=0.3, linestyle='--')
+    if single:
+        width = 0.8
+    offsets = (np.arange(len(series)) - (len(series) - 1) / 2) * width
+    errorbar_style = {'capsize': 5, 'linewidth': 2} if single else {'capsize': 4}
+
+    drawn = []
+    for (key, label, color, show_ci), offset in zip(series, offsets):
+        means = metrics[key].to_numpy()
+        errors = metrics[f'{key}_margin'].to_numpy()
+
+        if isinstance(color, (list, tuple)):
+            color = color[:len(configs)]
+
+        if single:
+            # Attach the CI to the bars so bar_label anchors above the error bar
+            bars = ax.bar(x + offset, means, width, label=label,
+                          color=color, alpha=0.8,
+                          yerr=np.nan_to_num(errors), error_kw={'ecolor': 'black', **errorbar_style})
+        else:
+            bars = ax.bar(x + offset, means, width, label=label,
+                          color=color, alpha=0.8)
+        drawn.append((bars, means, errors, show_ci))
+
+    if not single:
+        for (bars, means, errors, show_ci), offset in zip(drawn, offsets):
+            if show_ci:
+                ax.errorbar(x + offset, means, yerr=errors, fmt='none', color='black', **errorbar_style)
+
+    for bars, means, errors, show_ci in drawn:
+        labels = []
+        for mean, err in zip(means, errors):
+            if skip_empty and not mean > 0:
+                labels.append('')
+            elif single and not np.isnan(err):
+                labels.append(value_format.format(mean) + f'\n±{err:.1f}')
+            else:
+                labels.append(value_format.format(mean))
 
-    plt.tight_layout()
-    output_file = OUTPUT_DIR / "3_network_latency_comparison.png"
-    plt.savefig(output_file, bbox_inches='tight')
+        if single:
+            ax.bar_label(bars, labels=labels, padding=3, fontweight='bold', fontsize=label_fontsize)
+        else:
+            ax.bar_label(bars, labels=labels, fontsize=label_fontsize)
+
+    ax.set_xlabel('Configuration')
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    ax.set_xticks(x)
+    ax.set_xticklabels([config_labels.get(c, c) for c in configs])
+    if ylim:
+        ax.set_ylim(*ylim)
+    if legend_loc:
+        ax.legend(loc=legend_loc)
+    ax.grid(axis='y')
+
+    save_figure(fig, output_file, CHART_DPI)
+    mark_figure_current(output_file, render_key)
     print(f"  Saved: {output_file.name}")
-    plt.close()
 
 
-def create_throughput_chart_with_ci(all_data):
-    """Creates throughput chart with error bars."""
-    print("\n[5] Generating network throughput chart with CI")
+def create_lateral_movement_chart_with_ci(metrics):
+    """Creates bar chart with 95% CI error bars."""
+    print("\n[2] Generating lateral movement success rate chart with CI")
 
-    if not all_data:
+    if metrics.empty:
         print("  No data to plot")
         return
 
-    config_order = ['baseline', 'config1', 'config2', 'config3']
-    configs = [c for c in config_order if c in all_data]
+    render_bar_chart(
+        metrics,
+        [('overall_success_rate', None, PALETTE_SUCCESS, True)],
+        'Lateral Movement Success Rate by Configuration (with 95% CI)',
+        'Lateral Movement Success Rate (%)',
+        "1_lateral_movement_success_rates",
+        config_labels=CONFIG_LABELS_LONG, ylim=(0, 110), value_format='{:.1f}%'
+    )
 
-    means = []
-    errors = []
 
-    for config in configs:
-        metric = all_data[config]['perf_metrics'].get('throughput', {})
-        means.append(metric.get('mean', 0))
-        errors.append(metric.get('margin', 0))
+def create_attack_breakdown_chart_with_ci(metrics):
+    """Creates grouped bar chart with error bars for RDP vs SMB."""
+    print("\n[3] Generating attack method breakdown chart with CI")
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    if metrics.empty:
+        print("  No data to plot")
+        return
 
-    colors = ['#3498db', '#9b59b6', '#1abc9c', '#e67e22']
-    x = range(len(configs))
+    render_bar_chart(
+        metrics,
+        [('rdp_success_rate', 'RDP', '#e74c3c', True),
+         ('smb_success_rate', 'SMB', '#3498db', True)],
+        'Lateral Movement Success Rate by Attack Method (with 95% CI)',
+        'Success Rate (%)',
+        "2_attack_method_breakdown",
+        ylim=(0, 110), legend_loc='upper right', value_format='{:.0f}%'
+    )
 
-    bars = ax.bar(x, means, color=colors[:len(configs)], alpha=0.8, edgecolor='black')
-    ax.errorbar(x, means, yerr=errors, fmt='none', color='black', capsize=5, linewidth=2)
 
-    for bar, mean, err in zip(bars, means, errors):
-        height = bar.get_height()
-        if not np.isnan(err) and height > 0:
-            ax.text(bar.get_x() + bar.get_width()/2., height + err + 2,
-                    f'{mean:.1f}\n±{err:.1f}',
-                    ha='center', va='bottom', fontweight='bold', fontsize=10)
-        elif height > 0:
-            ax.text(bar.get_x() + bar.get_width()/2., height + 2,
-                    f'{mean:.1f}',
-                    ha='center', va='bottom', fontweight='bold', fontsize=10)
+def create_latency_chart_with_ci(metrics):
+    """Creates latency comparison chart with error bars."""
+    print("\n[4] Generating network latency comparison chart with CI")
 
-    ax.set_xlabel('Configuration', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Throughput (Mbps)', fontsize=12, fontweight='bold')
-    ax.set_title('Network Throughput Comparison (with 95% CI)', fontsize=14, fontweight='bold', pad=20)
-    ax.set_xticks(x)
-    config_labels = {
-        'baseline': 'Baseline',
-        'config1': 'Config 1\n(NSG)',
-        'config2': 'Config 2\n(ASG)',
-        'config3': 'Config 3\n(Firewall)'
-    }
-    ax.set_xticklabels([config_labels.get(c, c) for c in configs], fontsize=10)
-    ax.grid(axis='y', alpha=0.3, linestyle='--')
+    if metrics.empty:
+        print("  No data to plot")
+        return
 
-    plt.tight_layout()
-    output_file = OUTPUT_DIR / "4_network_throughput.png"
-    plt.savefig(output_file, bbox_inches='tight')
-    print(f"  Saved: {output_file.name}")
-    plt.close()
+    render_bar_chart(
+        metrics,
+        [('latency_avg', 'Average', '#2ecc71', True),
+         ('latency_p95', 'P95', '#f39c12', False),
+         ('latency_p99', 'P99', '#e74c3c', False)],
+        'Network Latency Comparison (with 95% CI on Average)',
+        'Latency (milliseconds)',
+        "3_network_latency_comparison",
+        width=0.25, legend_loc='upper left', label_fontsize=8, skip_empty=True
+    )
 
 
-def create_resource_utilization_chart_with_ci(all_data):
-    """Creates resource utilization chart with error bars."""
-    print("\n[6] Generating resource utilization chart with CI")
+def create_throughput_chart_with_ci(metrics):
+    """Creates throughput chart with error bars."""
+    print("\n[5] Generating network throughput chart with CI")
 
-    if not all_data:
+    if metrics.empty:
         print("  No data to plot")
         return
 
-    config_order = ['baseline', 'config1', 'config2', 'config3']
-    configs = [c for c in config_order if c in all_data]
+    render_bar_chart(
+        metrics,
+        [('throughput', None, PALETTE_THROUGHPUT, True)],
+        'Network Throughput Comparison (with 95% CI)',
+        'Throughput (Mbps)',
+        "4_network_throughput",
+        label_fontsize=10, skip_empty=True
+    )
 
-    cpu_means = []
-    cpu_errors = []
-    mem_means = []
-    mem_errors = []
 
-    for config in configs:
-        cpu_metric = all_data[config]['perf_metrics'].get('cpu_usage', {})
-        mem_metric = all_data[config]['perf_metrics'].get('memory_usage', {})
+def create_resource_utilization_chart_with_ci(metrics):
+    """Creates resource utilization chart with error bars."""
+    print("\n[6] Generating resource utilization chart with CI")
 
-        cpu_means.append(cpu_metric.get('mean', 0))
-        cpu_errors.append(cpu_metric.get('margin', 0))
-        mem_means.append(mem_metric.get('mean', 0))
-        mem_errors.append(mem_metric.get('margin', 0))
+    if metrics.empty:
+        print("  No data to plot")
+        return
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    render_bar_chart(
+        metrics,
+        [('cpu_usage', 'CPU Usage', '#e74c3c', True),
+         ('memory_usage', 'Memory Usage', '#3498db', True)],
+        'Resource Utilization Comparison (with 95% CI)',
+        'Utilization (%)',
+        "5_resource_utilization",
+        ylim=(0, 100), legend_loc='upper right', value_format='{:.1f}%', skip_empty=True
+    )
 
-    x = np.arange(len(configs))
-    width = 0.35
-
-    bars1 = ax.bar(x - width/2, cpu_means, width, label='CPU Usage',
-                   color='#e74c3c', alpha=0.8, edgecolor='black')
-    bars2 = ax.bar(x + width/2, mem_means, width, label='Memory Usage',
-                   color='#3498db', alpha=0.8, edgecolor='black')
-
-    ax.errorbar(x - width/2, cpu_means, yerr=cpu_errors, fmt='none', color='black', capsize=4)
-    ax.errorbar(x + width/2, mem_means, yerr=mem_errors, fmt='none', color='black', capsize=4)
-
-    for bars in [bars1, bars2]:
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{height:.1f}%',
-                        ha='center', va='bottom', fontsize=9)
-
-    ax.set_xlabel('Configuration', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Utilization (%)', fontsize=12, fontweight='bold')
-    ax.set_title('Resource Utilization Comparison (with 95% CI)', fontsize=14, fontweight='bold', pad=20)
-    ax.set_xticks(x)
-    config_labels = {
-        'baseline': 'Baseline',
-        'config1': 'Config 1\n(NSG)',
-        'config2': 'Config 2\n(ASG)',
-        'config3': 'Config 3\n(Firewall)'
-    }
-    ax.set_xticklabels([config_labels.get(c, c) for c in configs], fontsize=10)
-    ax.set_ylim(0, 100)
-    ax.legend(fontsize=11, loc='upper right')
-    ax.grid(axis='y', alpha=0.3, linestyle='--')
-
-    plt.tight_layout()
-    output_file = OUTPUT_DIR / "5_resource_utilization.png"
-    plt.savefig(output_file, bbox_inches='tight')
-    print(f"  Saved: {output_file.name}")
-    plt.close()
 
-
-def create_heatmap(all_data):
+def create_heatmap(metrics):
     """Creates attack success heatmap."""
     print("\n[7] Generating attack success heatmap")
 
-    if not all_data:
+    if metrics.empty:
         print("  No data to plot")
         return
 
-    config_order = ['baseline', 'config1', 'config2', 'config3']
-    configs = [c for c in config_order if c in all_data]
+    heatmap_data = metrics[['rdp_success_rate', 'smb_success_rate']]
+    output_file = figure_path("6_attack_success_heatmap")
+    is_current, render_key = figure_is_current(output_file, frame_inputs(heatmap_data), CHART_DPI)
+    if is_current:
+        print(f"  Up to date: {output_file.name}")
+        return
 
-    rdp_values = []
-    smb_values = []
+    values = heatmap_data.to_numpy()
+    rows, cols = values.shape
 
-    for config in configs:
-        rdp_metric = all_data[config]['attack_metrics'].get('rdp_success_rate', {})
-        smb_metric = all_data[config]['attack_metrics'].get('smb_success_rate', {})
-        rdp_values.append(rdp_metric.get('mean', 0))
-        smb_values.append(smb_metric.get('mean', 0))
+    fig = reset_shared_figure((8, 6))
+    ax = fig.add_subplot()
 
-    heatmap_data = pd.DataFrame({
-        'RDP': rdp_values,
-        'SMB': smb_values
-    })
+    # One mesh cell per config/method, drawn top-down in matrix order
+    mesh = ax.pcolormesh(values, cmap='RdYlGn_r', vmin=0, vmax=100,
+                         edgecolors='black', linewidth=2)
+    ax.set_xlim(0, cols)
+    ax.set_ylim(rows, 0)
+    ax.spines[:].set_visible(False)
 
-    config_label_map = {
-        'baseline': 'Baseline',
-        'config1': 'Config 1 (NSG)',
-        'config2': 'Config 2 (ASG)',
-        'config3': 'Config 3 (Firewall)'
-    }
-    heatmap_data.index = [config_label_map.get(c, c) for c in configs]
+    colorbar = fig.colorbar(mesh, ax=ax, label='Success Rate (%)')
+    colorbar.outline.set_linewidth(0)
 
-    fig, ax = plt.subplots(figsize=(8, 6))
+    ax.set_xticks(np.arange(cols) + 0.5, ['RDP', 'SMB'])
+    ax.set_yticks(np.arange(rows) + 0.5, [CONFIG_LABELS_TABLE.get(c, c) for c in metrics.index],
+                  va='center')
 
-    sns.heatmap(heatmap_data, annot=True, fmt='.1f', cmap='RdYlGn_r',
-                linewidths=2, linecolor='black', cbar_kws={'label': 'Success Rate (%)'},
-                vmin=0, vmax=100, ax=ax)
+    # Dark text on light cells and white text on dark cells (WCAG relative luminance)
+    rgb = mesh.to_rgba(values)[..., :3]
+    rgb = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    text_colors = np.where(rgb @ [0.2126, 0.7152, 0.0722] > 0.408, '.15', 'w')
+    for (i, j), value in np.ndenumerate(values):
+        ax.text(j + 0.5, i + 0.5, f'{value:.1f}', color=text_colors[i, j], ha='center', va='center')
 
     ax.set_title('Attack Success Rate Heatmap', fontsize=14, fontweight='bold', pad=20)
     ax.set_xlabel('Attack Method', fontsize=12, fontweight='bold')
     ax.set_ylabel('Configuration', fontsize=12, fontweight='bold')
 
-    plt.tight_layout()
-    output_file = OUTPUT_DIR / "6_attack_success_heatmap.png"
-    plt.savefig(output_file, bbox_inches='tight')
+    save_figure(fig, output_file, CHART_DPI)
+    mark_figure_current(output_file, render_key)
     print(f"  Saved: {output_file.name}")
-    plt.close()
+
+
+def render_chart_job(renderer, metrics):
+    """
+    Runs one chart renderer in a worker process.
+
+    Returns:
+        The renderer's progress output, so the parent can print it in order
+    """
+    output = io.StringIO()
+    with redirect_stdout(output):
+        renderer(metrics)
+        pyplot().close(shared_figure())
+        shared_figure.cache_clear()
+    return output.getvalue()
+
+
+def render_charts(metrics):
+    """
+    Renders the independent bar charts and heatmap in parallel worker processes.
+
+    Every chart reads its columns from the one metrics frame, so workers
+    only receive that small table rather than the raw iteration data.
+
+    Rasterising and encoding each PNG is CPU-bound, so the charts are spread
+    over processes rather than threads. Progress messages are printed in
+    the usual chart order once each chart has finished.
+    """
+    renderers = (
+        create_lateral_movement_chart_with_ci,
+        create_attack_breakdown_chart_with_ci,
+        create_latency_chart_with_ci,
+        create_throughput_chart_with_ci,
+        create_resource_utilization_chart_with_ci,
+        create_heatmap
+    )
+
+    workers = min(len(renderers), os.cpu_count() or 1)
+    if workers == 1:
+        for renderer in renderers:
+            renderer(metrics)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for output in executor.map(render_chart_job, renderers, repeat(metrics)):
+            print(output, end='')
 
 
 # ============================================================================
 # ENHANCED STATISTICAL OUTPUTS
 # ============================================================================
 
-def create_enhanced_comparison_table(all_data):
+def write_csv(csv_file, header, rows):
+    """
+    Writes rows to a UTF-8 CSV file in a single buffered pass.
+
+    Matches the layout pandas' to_csv produced: '\n' line endings, minimal
+    quoting and NaN written as an empty field.
+
+    Args:
+        csv_file: Output path
+        header: Column names
+        rows: Iterable of row value sequences
+    """
+    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(header)
+        writer.writerows(
+            ['' if isinstance(v, float) and math.isnan(v) else v for v in row]
+            for row in rows
+        )
+
+
+def build_metrics_frame(all_data):
+    """
+    Flattens the aggregated metric means and CI margins into one table.
+
+    Args:
+        all_data: Dict mapping config names to aggregated data
+
+    Returns:
+        DataFrame indexed by config in CONFIG_ORDER, with one column of means
+        per metric and a '<metric>_margin' column of CI margins. Metrics a
+        config has no data for read as 0, as in the charts.
+    """
+    records = {}
+    for config in CONFIG_ORDER:
+        if config not in all_data:
+            continue
+        data = all_data[config]
+        record = {}
+        for section, keys in (('attack_metrics', ATTACK_METRICS), ('perf_metrics', PERF_METRICS)):
+            for key in keys:
+                metric = data[section].get(key, {})
+                record[key] = metric.get('mean', 0)
+                record[f'{key}_margin'] = metric.get('margin', 0)
+        records[config] = record
+
+    return pd.DataFrame.from_dict(records, orient='index', dtype=np.float64)
+
+
+def compute_baseline_stats(all_data):
+    """
+    Computes the baseline figures shared by the statistical outputs.
+
+    Args:
+        all_data: Dict mapping config names to aggregated data
+
+    Returns:
+        Dict with baseline 'n' and 'cohens_d' (metric -> {config: d vs baseline}),
+        or None without baseline data
+    """
+    if not all_data or 'baseline' not in all_data:
+        return None
+
+    baseline = all_data['baseline']
+    configs = [c for c in CONFIG_ORDER[1:] if c in all_data]
+
+    cohens_d = {}
+    for section, key in EFFECT_SIZE_METRICS:
+        groups = [all_data[c][section][key] for c in configs]
+        values = calculate_cohens_d_batch(baseline[section][key], groups) if groups else ()
+        cohens_d[key] = dict(zip(configs, values))
+
+    return {'n': baseline['n'], 'cohens_d': cohens_d}
+
+
+def format_values(values, fmt, missing="N/A"):
+    """
+    Formats a column of numbers with one format string.
+
+    Args:
+        values: Iterable of numbers
+        fmt: str.format pattern, e.g. '{:+.1f}%'
+        missing: Text used for NaN values
+
+    Returns:
+        List of formatted strings
+    """
+    fmt = fmt.format
+    return [missing if math.isnan(v) else fmt(v) for v in values]
+
+
+def draw_styled_table(ax, columns, cell_text, **kwargs):
+    """
+    Draws a table with a blue header row and a shaded label column.
+
+    Cell colours are passed to ax.table up front, so only the header row and
+    the label column need their text styled afterwards.
+
+    Args:
+        ax: Axes to draw on
+        columns: Column headers
+        cell_text: List of rows, each a list of cell values; the first
+                   value of each row labels it
+        **kwargs: Extra ax.table arguments (e.g. colWidths)
+
+    Returns:
+        The matplotlib Table
+    """
+    nrows, ncols = len(cell_text), len(columns)
+    colours = np.full((nrows, ncols), 'white', dtype=object)
+    colours[:, 0] = '#ecf0f1'
+
+    table = ax.table(cellText=cell_text,
+                     colLabels=columns,
+                     cellColours=colours.tolist(),
+                     colColours=['#3498db'] * ncols,
+                     cellLoc='center',
+                     loc='center',
+                     **kwargs)
+
+    for j in range(ncols):
+        table[0, j].set_text_props(weight='bold', color='white')
+    for i in range(1, nrows + 1):
+        table[i, 0].set_text_props(weight='bold')
+
+    return table
+
+
+def create_enhanced_comparison_table(all_data, metrics, baseline_stats):
     """Creates detailed comparison table with CI, deltas, and effect sizes."""
     print("\n[8] Generating enhanced comparison table with statistics")
 
@@ -811,419 +1266,296 @@ def create_enhanced_comparison_table(all_data):
         print("  No data to create table")
         return
 
-    config_order = ['baseline', 'config1', 'config2', 'config3']
-    configs = [c for c in config_order if c in all_data]
+    configs = [c for c in CONFIG_ORDER if c in all_data]
 
-    if 'baseline' not in all_data:
+    if baseline_stats is None:
         print("  Warning: No baseline data for comparison")
         return
 
-    baseline = all_data['baseline']
-
-    rows = []
-    for config in configs:
-        data = all_data[config]
-
-        success_metric = data['attack_metrics'].get('overall_success_rate', {})
-        latency_metric = data['perf_metrics'].get('latency_avg', {})
-        cpu_metric = data['perf_metrics'].get('cpu_usage', {})
-        mem_metric = data['perf_metrics'].get('memory_usage', {})
-
-        success_mean = success_metric.get('mean', 0)
-        success_ci = success_metric.get('margin', 0)
-        latency_mean = latency_metric.get('mean', 0)
-        latency_ci = latency_metric.get('margin', 0)
-        cpu_mean = cpu_metric.get('mean', 0)
-        mem_mean = mem_metric.get('mean', 0)
-
-        if config != 'baseline':
-            baseline_success = baseline['attack_metrics']['overall_success_rate']['mean']
-            baseline_latency = baseline['perf_metrics']['latency_avg']['mean']
-            baseline_cpu = baseline['perf_metrics']['cpu_usage']['mean']
-
-            delta_success = success_mean - baseline_success
-            delta_success_pct = (delta_success / baseline_success * 100) if baseline_success != 0 else 0
-            delta_latency = latency_mean - baseline_latency
-            delta_latency_pct = (delta_latency / baseline_latency * 100) if baseline_latency != 0 else 0
-            delta_cpu = cpu_mean - baseline_cpu
-
-            success_iters = [it['overall_success_rate'] for it in data['attack_iterations']]
-            baseline_success_iters = [it['overall_success_rate'] for it in baseline['attack_iterations']]
-            cohens_d = calculate_cohens_d(baseline_success_iters, success_iters)
-            effect = interpret_effect_size(cohens_d)
-            power = calculate_statistical_power(cohens_d, data['n'])
-            power_interp = interpret_power(power)
-        else:
-            delta_success = 0
-            delta_success_pct = 0
-            delta_latency = 0
-            delta_latency_pct = 0
-            delta_cpu = 0
-            cohens_d = 0
-            effect = "Baseline"
-            power = 1.0
-            power_interp = "Baseline"
-
-        row = {
-            'Configuration': config,
-            'n': data['n'],
-            'Success_Rate': f"{success_mean:.1f}±{success_ci:.1f}%",
-            'Δ_Success_vs_Baseline': f"{delta_success:+.1f}%",
-            'Δ_Success_Pct': f"{delta_success_pct:+.1f}%",
-            'Cohens_d': f"{cohens_d:.3f}" if not np.isnan(cohens_d) else "N/A",
-            'Effect_Size': effect,
-            'Latency_ms': f"{latency_mean:.2f}±{latency_ci:.2f}" if not np.isnan(latency_ci) else f"{latency_mean:.2f}",
-            'Δ_Latency_ms': f"{delta_latency:+.2f}",
-            'Δ_Latency_Pct': f"{delta_latency_pct:+.1f}%",
-            'CPU_%': f"{cpu_mean:.1f}",
-            'Memory_%': f"{mem_mean:.1f}",
-            'Δ_CPU': f"{delta_cpu:+.1f}",
-            'Statistical_Power': f"{power:.3f}" if not np.isnan(power) else "N/A"
-        }
-        rows.append(row)
+    frame = metrics.loc[configs]
+    compared = configs[1:]
+
+    # Deltas and effect sizes against baseline; the baseline row itself reads 0
+    deltas = frame - frame.loc['baseline']
+    deltas.loc['baseline'] = 0
+
+    def percent_change(metric):
+        baseline_value = frame.at['baseline', metric]
+        if baseline_value == 0:
+            return [0] * len(configs)
+        return deltas[metric] / baseline_value * 100
+
+    success_pct = percent_change('overall_success_rate')
+    latency_pct = percent_change('latency_avg')
+
+    cohens_d = [0] + [baseline_stats['cohens_d']['overall_success_rate'][c] for c in compared]
+    power = [1.0] + [calculate_statistical_power(d, all_data[c]['n']) for c, d in zip(compared, cohens_d[1:])]
+    effect = ["Baseline"] + [interpret_effect_size(d) for d in cohens_d[1:]]
+
+    table_columns = {
+        'Configuration': configs,
+        'n': [all_data[c]['n'] for c in configs],
+        'Success_Rate': [f"{m:.1f}±{ci:.1f}%" for m, ci in zip(frame['overall_success_rate'], frame['overall_success_rate_margin'])],
+        'Δ_Success_vs_Baseline': format_values(deltas['overall_success_rate'], "{:+.1f}%"),
+        'Δ_Success_Pct': format_values(success_pct, "{:+.1f}%"),
+        'Cohens_d': format_values(cohens_d, "{:.3f}"),
+        'Effect_Size': effect,
+        'Latency_ms': [f"{m:.2f}" if math.isnan(ci) else f"{m:.2f}±{ci:.2f}"
+                       for m, ci in zip(frame['latency_avg'], frame['latency_avg_margin'])],
+        'Δ_Latency_ms': format_values(deltas['latency_avg'], "{:+.2f}"),
+        'Δ_Latency_Pct': format_values(latency_pct, "{:+.1f}%"),
+        'CPU_%': format_values(frame['cpu_usage'], "{:.1f}"),
+        'Memory_%': format_values(frame['memory_usage'], "{:.1f}"),
+        'Δ_CPU': format_values(deltas['cpu_usage'], "{:+.1f}"),
+        'Statistical_Power': format_values(power, "{:.3f}")
+    }
 
-    df = pd.DataFrame(rows)
+    columns = list(table_columns)
+    cell_text = [list(row) for row in zip(*table_columns.values())]
 
     csv_file = OUTPUT_DIR / "enhanced_comparison_table.csv"
-    df.to_csv(csv_file, index=False)
+    write_csv(csv_file, columns, cell_text)
     print(f"  Saved: {csv_file.name}")
 
-    fig, ax = plt.subplots(figsize=(16, len(rows) * 0.8 + 2))
-    ax.axis('tight')
-    ax.axis('off')
+    for cells in cell_text:
+        cells[0] = CONFIG_LABELS_TABLE.get(cells[0], cells[0])
 
-    config_label_map = {
-        'baseline': 'Baseline',
-        'config1': 'Config 1 (NSG)',
-        'config2': 'Config 2 (ASG)',
-        'config3': 'Config 3 (Firewall)'
-    }
-    df['Configuration'] = df['Configuration'].map(lambda x: config_label_map.get(x, x))
+    output_file = figure_path("8_enhanced_comparison_table")
+    is_current, render_key = figure_is_current(output_file, (columns, cell_text), TABLE_DPI)
+    if is_current:
+        print(f"  Up to date: {output_file.name}")
+        return
 
-    table = ax.table(cellText=df.values,
-                     colLabels=df.columns,
-                     cellLoc='center',
-                     loc='center',
-                     colWidths=[0.09, 0.04, 0.11, 0.10, 0.10, 0.08, 0.11, 0.11, 0.10, 0.10, 0.07, 0.07, 0.07, 0.10])
+    fig = reset_shared_figure((16, len(cell_text) * 0.8 + 2), layout=None)
+    # Tables fill the whole figure; bbox_inches='tight' crops the margins on save
+    ax = fig.add_axes((0, 0, 1, 1))
+    ax.axis('off')
+
+    table = draw_styled_table(ax, columns, cell_text,
+                              colWidths=[0.09, 0.04, 0.11, 0.10, 0.10, 0.08, 0.11, 0.11, 0.10, 0.10, 0.07, 0.07, 0.07, 0.10])
 
     table.auto_set_font_size(False)
     table.set_fontsize(7)
     table.scale(1, 2)
 
-    for (i, j), cell in table.get_celld().items():
-        if i == 0:
-            cell.set_facecolor('#3498db')
-            cell.set_text_props(weight='bold', color='white')
-        else:
-            if j == 0:
-                cell.set_facecolor('#ecf0f1')
-                cell.set_text_props(weight='bold')
-            else:
-                cell.set_facecolor('white')
-
-    plt.title('Enhanced Statistical Comparison Table', fontsize=16, fontweight='bold', pad=20)
-    plt.tight_layout()
+    ax.set_title('Enhanced Statistical Comparison Table', fontsize=16, fontweight='bold', pad=20)
 
-    output_file = OUTPUT_DIR / "8_enhanced_comparison_table.png"
-    plt.savefig(output_file, bbox_inches='tight')
+    save_figure(fig, output_file, TABLE_DPI, bbox_inches='tight')
+    mark_figure_current(output_file, render_key)
     print(f"  Saved: {output_file.name}")
-    plt.close()
 
 
-def create_effect_size_analysis(all_data):
+def create_effect_size_analysis(all_data, baseline_stats):
     """Creates effect size analysis visualization."""
     print("\n[9] Generating effect size analysis chart")
 
-    if not all_data or 'baseline' not in all_data:
+    if baseline_stats is None:
         print("  Need baseline data for effect size analysis")
         return
 
-    config_order = ['config1', 'config2', 'config3']
-    configs = [c for c in config_order if c in all_data]
+    configs = [c for c in CONFIG_ORDER[1:] if c in all_data]
 
     if not configs:
         print("  Need comparison configs for effect size analysis")
         return
 
-    baseline = all_data['baseline']
-
-    comparisons = []
-    for config in configs:
-        data = all_data[config]
-
-        baseline_success = [it['overall_success_rate'] for it in baseline['attack_iterations']]
-        config_success = [it['overall_success_rate'] for it in data['attack_iterations']]
-        d_success = calculate_cohens_d(baseline_success, config_success)
-
-        baseline_latency = [it['latency_avg'] for it in baseline['perf_iterations']]
-        config_latency = [it['latency_avg'] for it in data['perf_iterations']]
-        d_latency = calculate_cohens_d(baseline_latency, config_latency)
-
-        baseline_cpu = [it['cpu_usage'] for it in baseline['perf_iterations']]
-        config_cpu = [it['cpu_usage'] for it in data['perf_iterations']]
-        d_cpu = calculate_cohens_d(baseline_cpu, config_cpu)
-
-        comparisons.append({
-            'Comparison': f"Baseline vs {config}",
-            'Success_Rate_d': d_success,
-            'Latency_d': d_latency,
-            'CPU_d': d_cpu
-        })
+    cohens_d = baseline_stats['cohens_d']
 
-    df = pd.DataFrame(comparisons)
+    df = pd.DataFrame({
+        'Comparison': [f"Baseline vs {config}" for config in configs],
+        'Success_Rate_d': [cohens_d['overall_success_rate'][config] for config in configs],
+        'Latency_d': [cohens_d['latency_avg'][config] for config in configs],
+        'CPU_d': [cohens_d['cpu_usage'][config] for config in configs]
+    })
 
     csv_file = OUTPUT_DIR / "effect_size_analysis.csv"
-    df.to_csv(csv_file, index=False)
+    write_csv(csv_file, df.columns, df.itertuples(index=False))
     print(f"  Saved: {csv_file.name}")
 
-    fig, axes = plt.subplots(1, 3, figsize=(15, 5))
+    output_file = figure_path("9_effect_size_analysis")
+    is_current, render_key = figure_is_current(output_file, frame_inputs(df.set_index('Comparison')), CHART_DPI)
+    if is_current:
+        print(f"  Up to date: {output_file.name}")
+        return
+
+    fig = reset_shared_figure((15, 5))
+    axes = fig.subplots(1, 3)
 
     metrics = ['Success_Rate_d', 'Latency_d', 'CPU_d']
     titles = ['Lateral Movement Success Rate', 'Network Latency', 'CPU Usage']
+    x = np.arange(len(df))
+    tick_labels = [f"vs\n{c.split()[-1]}" for c in df['Comparison']]
 
     for ax, metric, title in zip(axes, metrics, titles):
-        values = df[metric].values
-        x = range(len(values))
-
-        colors = []
-        for v in values:
-            abs_v = abs(v) if not np.isnan(v) else 0
-            if abs_v < 0.2:
-                colors.append('gray')
-            elif abs_v < 0.5:
-                colors.append('yellow')
-            elif abs_v < 0.8:
-                colors.append('orange')
-            else:
-                colors.append('red')
+        values = df[metric].to_numpy()
+
+        abs_values = np.abs(np.nan_to_num(values))
+        colors = np.select([abs_values < 0.2, abs_values < 0.5, abs_values < 0.8],
+                           ['gray', 'yellow', 'orange'], default='red')
 
         bars = ax.bar(x, values, color=colors, alpha=0.7, edgecolor='black')
 
         ax.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
-        ax.axhline(y=0.2, color='gray', linestyle='--', linewidth=1, alpha=0.5)
-        ax.axhline(y=-0.2, color='gray', linestyle='--', linewidth=1, alpha=0.5)
-        ax.axhline(y=0.5, color='orange', linestyle='--', linewidth=1, alpha=0.5)
-        ax.axhline(y=-0.5, color='orange', linestyle='--', linewidth=1, alpha=0.5)
-        ax.axhline(y=0.8, color='red', linestyle='--', linewidth=1, alpha=0.5)
-        ax.axhline(y=-0.8, color='red', linestyle='--', linewidth=1, alpha=0.5)
-
-        for bar, val in zip(bars, values):
-            if not np.isnan(val):
-                ax.text(bar.get_x() + bar.get_width()/2., val,
-                        f'{val:.2f}',
-                        ha='center', va='bottom' if val > 0 else 'top', fontsize=10, fontweight='bold')
+        # Small/medium/large thresholds as one collection spanning the axes width
+        ax.hlines(EFFECT_SIZE_THRESHOLDS, 0, 1, transform=ax.get_yaxis_transform(),
+                  colors=EFFECT_SIZE_THRESHOLD_COLORS, linestyles='--', linewidth=1, alpha=0.5)
+
+        ax.bar_label(bars, labels=format_values(values, '{:.2f}', missing=''),
+                     fontsize=10, fontweight='bold')
 
         ax.set_title(title, fontsize=11, fontweight='bold')
         ax.set_ylabel("Cohen's d", fontsize=10)
         ax.set_xticks(x)
-        ax.set_xticklabels([f"vs\n{c.split()[-1]}" for c in df['Comparison']], fontsize=9)
+        ax.set_xticklabels(tick_labels, fontsize=9)
         ax.grid(axis='y', alpha=0.3)
 
-    plt.suptitle("Effect Size Analysis (Cohen's d)", fontsize=14, fontweight='bold')
-    plt.tight_layout()
+    fig.suptitle("Effect Size Analysis (Cohen's d)", fontsize=14, fontweight='bold')
 
-    output_file = OUTPUT_DIR / "9_effect_size_analysis.png"
-    plt.savefig(output_file, bbox_inches='tight')
+    save_figure(fig, output_file, CHART_DPI)
+    mark_figure_current(output_file, render_key)
     print(f"  Saved: {output_file.name}")
-    plt.close()
 
 
-def create_power_analysis_table(all_data):
+def create_power_analysis_table(all_data, baseline_stats):
     """Creates statistical power analysis table."""
     print("\n[10] Generating statistical power analysis")
 
-    if not all_data or 'baseline' not in all_data:
+    if baseline_stats is None:
         print("  Need baseline data for power analysis")
         return
 
-    config_order = ['config1', 'config2', 'config3']
-    configs = [c for c in config_order if c in all_data]
+    configs = [c for c in CONFIG_ORDER[1:] if c in all_data]
 
     if not configs:
         print("  Need comparison configs for power analysis")
         return
 
-    baseline = all_data['baseline']
-
-    rows = []
-    for config in configs:
-        data = all_data[config]
-        n = min(baseline['n'], data['n'])
-
-        baseline_success = [it['overall_success_rate'] for it in baseline['attack_iterations']]
-        config_success = [it['overall_success_rate'] for it in data['attack_iterations']]
-        d_success = calculate_cohens_d(baseline_success, config_success)
-        power_success = calculate_statistical_power(d_success, n)
-
-        baseline_latency = [it['latency_avg'] for it in baseline['perf_iterations']]
-        config_latency = [it['latency_avg'] for it in data['perf_iterations']]
-        d_latency = calculate_cohens_d(baseline_latency, config_latency)
-        power_latency = calculate_statistical_power(d_latency, n)
+    cohens_d = baseline_stats['cohens_d']
+    n = [min(baseline_stats['n'], all_data[c]['n']) for c in configs]
+    d_success = [cohens_d['overall_success_rate'][c] for c in configs]
+    d_latency = [cohens_d['latency_avg'][c] for c in configs]
 
-        rows.append({
-            'Comparison': f"Baseline vs {config}",
-            'n': n,
-            'Success_Rate_d': f"{d_success:.3f}" if not np.isnan(d_success) else "N/A",
-            'Success_Rate_Power': f"{power_success:.3f}" if not np.isnan(power_success) else "N/A",
-            'Latency_d': f"{d_latency:.3f}" if not np.isnan(d_latency) else "N/A",
-            'Latency_Power': f"{power_latency:.3f}" if not np.isnan(power_latency) else "N/A"
-        })
+    table_columns = {
+        'Comparison': [f"Baseline vs {config}" for config in configs],
+        'n': n,
+        'Success_Rate_d': format_values(d_success, "{:.3f}"),
+        'Success_Rate_Power': format_values(map(calculate_statistical_power, d_success, n), "{:.3f}"),
+        'Latency_d': format_values(d_latency, "{:.3f}"),
+        'Latency_Power': format_values(map(calculate_statistical_power, d_latency, n), "{:.3f}")
+    }
 
-    df = pd.DataFrame(rows)
+    columns = list(table_columns)
+    cell_text = [list(row) for row in zip(*table_columns.values())]
 
     csv_file = OUTPUT_DIR / "statistical_power_analysis.csv"
-    df.to_csv(csv_file, index=False)
+    write_csv(csv_file, columns, cell_text)
     print(f"  Saved: {csv_file.name}")
 
-    fig, ax = plt.subplots(figsize=(14, len(rows) * 0.8 + 2))
-    ax.axis('tight')
+    output_file = figure_path("10_statistical_power_analysis")
+    is_current, render_key = figure_is_current(output_file, (columns, cell_text), TABLE_DPI)
+    if is_current:
+        print(f"  Up to date: {output_file.name}")
+        return
+
+    fig = reset_shared_figure((14, len(cell_text) * 0.8 + 2), layout=None)
+    # Tables fill the whole figure; bbox_inches='tight' crops the margins on save
+    ax = fig.add_axes((0, 0, 1, 1))
     ax.axis('off')
 
-    table = ax.table(cellText=df.values,
-                     colLabels=df.columns,
-                     cellLoc='center',
-                     loc='center')
+    table = draw_styled_table(ax, columns, cell_text)
 
     table.auto_set_font_size(False)
     table.set_fontsize(9)
     table.scale(1, 2.5)
 
-    for (i, j), cell in table.get_celld().items():
-        if i == 0:
-            cell.set_facecolor('#3498db')
-            cell.set_text_props(weight='bold', color='white')
-        else:
-            if j == 0:
-                cell.set_facecolor('#ecf0f1')
-                cell.set_text_props(weight='bold')
-            else:
-                cell.set_facecolor('white')
-
-    plt.title('Statistical Power Analysis', fontsize=16, fontweight='bold', pad=20)
-    plt.tight_layout()
+    ax.set_title('Statistical Power Analysis', fontsize=16, fontweight='bold', pad=20)
 
-    output_file = OUTPUT_DIR / "10_statistical_power_analysis.png"
-    plt.savefig(output_file, bbox_inches='tight')
+    save_figure(fig, output_file, TABLE_DPI, bbox_inches='tight')
+    mark_figure_current(output_file, render_key)
     print(f"  Saved: {output_file.name}")
-    plt.close()
 
 
-def create_overhead_analysis(all_data):
+def create_overhead_analysis(metrics):
     """Creates performance overhead analysis relative to baseline."""
     print("\n[11] Generating performance overhead analysis")
 
-    if 'baseline' not in all_data:
+    if 'baseline' not in metrics.index:
         print("  No baseline data for overhead calculation")
         return
 
-    baseline = all_data['baseline']
-    baseline_latency = baseline['perf_metrics']['latency_avg']['mean']
-    baseline_throughput = baseline['perf_metrics']['throughput']['mean']
-    baseline_cpu = baseline['perf_metrics']['cpu_usage']['mean']
-    baseline_memory = baseline['perf_metrics']['memory_usage']['mean']
-
-    config_order = ['baseline', 'config1', 'config2', 'config3']
-    configs = [c for c in config_order if c in all_data]
-
-    rows = []
-    for config in configs:
-        data = all_data[config]
-
-        config_latency = data['perf_metrics']['latency_avg']['mean']
-        config_throughput = data['perf_metrics']['throughput']['mean']
-        config_cpu = data['perf_metrics']['cpu_usage']['mean']
-        config_memory = data['perf_metrics']['memory_usage']['mean']
-
-        latency_overhead = calculate_performance_overhead(baseline_latency, config_latency, 'latency')
-        throughput_overhead = calculate_performance_overhead(baseline_throughput, config_throughput, 'throughput')
-        cpu_overhead = calculate_performance_overhead(baseline_cpu, config_cpu, 'other')
-        memory_overhead = calculate_performance_overhead(baseline_memory, config_memory, 'other')
-
-        row = {
-            'Configuration': config,
-            'Latency_ms': f"{config_latency:.2f}" if config_latency > 0 else "N/A",
-            'Latency_Overhead_%': f"{latency_overhead:+.2f}%" if not np.isnan(latency_overhead) else "N/A",
-            'Throughput_Mbps': f"{config_throughput:.2f}" if config_throughput > 0 else "N/A",
-            'Throughput_Overhead_%': f"{throughput_overhead:+.2f}%" if not np.isnan(throughput_overhead) else "N/A",
-            'CPU_%': f"{config_cpu:.1f}",
-            'CPU_Overhead_%': f"{cpu_overhead:+.1f}%" if not np.isnan(cpu_overhead) else "N/A",
-            'Memory_%': f"{config_memory:.1f}",
-            'Memory_Overhead_%': f"{memory_overhead:+.1f}%" if not np.isnan(memory_overhead) else "0.0%"
-        }
-        rows.append(row)
-
-    df = pd.DataFrame(rows)
-
-    config_label_map = {
-        'baseline': 'Baseline',
-        'config1': 'Config 1 (NSG)',
-        'config2': 'Config 2 (ASG)',
-        'config3': 'Config 3 (Firewall)'
+    overhead = calculate_performance_overheads(metrics, OVERHEAD_METRICS)
+
+    columns = {
+        'Configuration': [CONFIG_LABELS_TABLE.get(c, c) for c in metrics.index],
+        'Latency_ms': [f"{v:.2f}" if v > 0 else "N/A" for v in metrics['latency_avg']],
+        'Latency_Overhead_%': format_values(overhead['latency_avg'], "{:+.2f}%"),
+        'Throughput_Mbps': [f"{v:.2f}" if v > 0 else "N/A" for v in metrics['throughput']],
+        'Throughput_Overhead_%': format_values(overhead['throughput'], "{:+.2f}%"),
+        'CPU_%': [f"{v:.1f}" for v in metrics['cpu_usage']],
+        'CPU_Overhead_%': format_values(overhead['cpu_usage'], "{:+.1f}%"),
+        'Memory_%': [f"{v:.1f}" for v in metrics['memory_usage']],
+        'Memory_Overhead_%': format_values(overhead['memory_usage'], "{:+.1f}%", missing="0.0%")
     }
-    df['Configuration'] = df['Configuration'].map(lambda x: config_label_map.get(x, x))
+    cell_text = [list(row) for row in zip(*columns.values())]
 
     csv_file = OUTPUT_DIR / "performance_overhead_analysis.csv"
-    df.to_csv(csv_file, index=False)
+    write_csv(csv_file, list(columns), cell_text)
     print(f"  Saved: {csv_file.name}")
 
-    fig, ax = plt.subplots(figsize=(14, len(rows) * 0.8 + 2))
-    ax.axis('tight')
+    output_file = figure_path("11_performance_overhead_analysis")
+    is_current, render_key = figure_is_current(output_file, (list(columns), cell_text), TABLE_DPI)
+    if is_current:
+        print(f"  Up to date: {output_file.name}")
+        return
+
+    fig = reset_shared_figure((14, len(cell_text) * 0.8 + 2), layout=None)
+    # Tables fill the whole figure; bbox_inches='tight' crops the margins on save
+    ax = fig.add_axes((0, 0, 1, 1))
     ax.axis('off')
 
-    table = ax.table(cellText=df.values, colLabels=df.columns,
-                    cellLoc='center', loc='center')
+    table = draw_styled_table(ax, list(columns), cell_text)
 
     table.auto_set_font_size(False)
     table.set_fontsize(9)
     table.scale(1, 2.5)
 
-    for (i, j), cell in table.get_celld().items():
-        if i == 0:
-            cell.set_facecolor('#3498db')
-            cell.set_text_props(weight='bold', color='white')
-        else:
-            if j == 0:
-                cell.set_facecolor('#ecf0f1')
-                cell.set_text_props(weight='bold')
-            else:
-                cell.set_facecolor('white')
-
-    plt.title('Performance Overhead Analysis (Relative to Baseline)', fontsize=16, fontweight='bold', pad=20)
-    plt.tight_layout()
+    ax.set_title('Performance Overhead Analysis (Relative to Baseline)', fontsize=16, fontweight='bold', pad=20)
 
-    output_file = OUTPUT_DIR / "11_performance_overhead_analysis.png"
-    plt.savefig(output_file, bbox_inches='tight')
+    save_figure(fig, output_file, TABLE_DPI, bbox_inches='tight')
+    mark_figure_current(output_file, render_key)
     print(f"  Saved: {output_file.name}")
-    plt.close()
 
 
 def export_individual_iterations(all_data):
     """Exports all individual iteration data for transparency."""
     print("\n[12] Exporting individual iteration data")
 
-    all_rows = []
-
-    for config_name, data in all_data.items():
-        for i, (attack_it, perf_it) in enumerate(zip(data['attack_iterations'], data['perf_iterations']), 1):
-            row = {
-                'Configuration': config_name,
-                'Iteration': i,
-                'Success_Rate': attack_it['overall_success_rate'],
-                'RDP_Success': attack_it['rdp_success_rate'],
-                'SMB_Success': attack_it['smb_success_rate'],
-                'Latency_Avg': perf_it['latency_avg'],
-                'Latency_P95': perf_it['latency_p95'],
-                'Latency_P99': perf_it['latency_p99'],
-                'Throughput': perf_it['throughput'],
-                'CPU_Usage': perf_it['cpu_usage'],
-                'Memory_Usage': perf_it['memory_usage']
-            }
-            all_rows.append(row)
-
-    df = pd.DataFrame(all_rows)
+    def iteration_rows():
+        blocks = []
+        for config_name, data in all_data.items():
+            columns = [data[section][key] for _, section, key in ITERATION_EXPORT_COLUMNS]
+            # Rows stop at the shorter of the attack and performance series
+            n = min(len(values) for values in columns)
+            blocks.append((config_name, [values[:n] for values in columns]))
+
+        # Like one DataFrame of all rows, each export column gets a single
+        # dtype across configs, so a config whose values are all the integer
+        # 0 fallback still writes 0.0 when other configs have floats
+        dtypes = []
+        for j in range(len(ITERATION_EXPORT_COLUMNS)):
+            exported = [columns[j] for _, columns in blocks if len(columns[j])]
+            dtypes.append(np.result_type(*exported) if exported else None)
+
+        for config_name, columns in blocks:
+            columns = [values if dtype is None else values.astype(dtype, copy=False)
+                       for values, dtype in zip(columns, dtypes)]
+            for i, values in enumerate(zip(*columns), start=1):
+                yield [config_name, i, *values]
 
     csv_file = OUTPUT_DIR / "individual_iterations.csv"
-    df.to_csv(csv_file, index=False)
+    write_csv(csv_file, ['Configuration', 'Iteration', *(name for name, _, _ in ITERATION_EXPORT_COLUMNS)],
+              iteration_rows())
+
     print(f"  Saved: {csv_file.name}")
 
 
@@ -1233,6 +1565,10 @@ def export_individual_iterations(all_data):
 
 def main():
     """Main execution function."""
+    print("=" * 70)
+    print("Enhanced Statistical Analysis - Azure Micro-Segmentation Research")
+    print("=" * 70)
+    print()
 
     all_data = load_all_configurations()
 
@@ -1243,30 +1579,32 @@ def main():
     print("Generating Visualizations")
     print("=" * 70)
 
-    create_lateral_movement_chart_with_ci(all_data)
-    create_attack_breakdown_chart_with_ci(all_data)
-    create_latency_chart_with_ci(all_data)
-    create_throughput_chart_with_ci(all_data)
-    create_resource_utilization_chart_with_ci(all_data)
-    create_heatmap(all_data)
+    metrics = build_metrics_frame(all_data)
+    render_charts(metrics)
 
     print("\n" + "=" * 70)
     print("Generating Enhanced Statistical Outputs")
     print("=" * 70)
 
-    create_enhanced_comparison_table(all_data)
-    create_effect_size_analysis(all_data)
-    create_power_analysis_table(all_data)
-    create_overhead_analysis(all_data)
+    baseline_stats = compute_baseline_stats(all_data)
+
+    create_enhanced_comparison_table(all_data, metrics, baseline_stats)
+    create_effect_size_analysis(all_data, baseline_stats)
+    create_power_analysis_table(all_data, baseline_stats)
+    create_overhead_analysis(metrics)
     export_individual_iterations(all_data)
 
+    pyplot().close(shared_figure())
+    shared_figure.cache_clear()
+
     print("\n" + "=" * 70)
     print("Analysis Complete")
     print("=" * 70)
     print(f"\nOutput directory: {OUTPUT_DIR.absolute()}")
     print("\nGenerated files:")
     for file in sorted(OUTPUT_DIR.glob("*")):
-        print(f"  {file.name}")
+        if file.is_file():
+            print(f"  {file.name}")
     print()
 
 